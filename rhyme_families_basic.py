@@ -41,12 +41,27 @@ Columns:
   all_words        — all qualifying members, frequency-sorted
 """
 
-import csv
+import functools
+import hashlib
+import heapq
+import math
+import os
+import pickle
 import re
-from collections import defaultdict
+import sys
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from pathlib import Path
 
 import nltk
-from wordfreq import zipf_frequency
+from wordfreq import get_frequency_dict, zipf_frequency
+
+try:
+    from importlib.metadata import version as _dist_version
+    _WORDFREQ_VERSION = _dist_version('wordfreq')
+except Exception:                                   # not installed as a dist
+    _WORDFREQ_VERSION = 'unknown'
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 ZIPF_CUTOFF     = 2.5   # Minimum Zipf score (log10-derived scale).
@@ -59,18 +74,72 @@ MAX_VARIANTS    = 6      # Max spelling variants shown in spelling_variants colu
 OUTPUT_TSV      = "rhyme_families_basic.tsv"
 # ─────────────────────────────────────────────────────────────────────────────
 
-# Matches the "(2)", "(3)" suffixes CMUdict appends to alternate pronunciations.
-_VARIANT_RE = re.compile(r'\(\d+\)$')
+# Part of the placements-cache key.  Bump whenever the filter/extract logic
+# or the pickled schema changes, or stale placements will be served from
+# ~/.cache/rhymefreq on the next run.
+_CACHE_VERSION = 1
 
+# Last vowel letter plus everything after it — the orthographic rime.
+# The search method is bound once; ortho_ending is hot enough that the
+# per-call attribute lookup shows up.
+_rime_search = re.compile(r'[aeiou][^aeiou]*$').search
 
-def strip_variant(word: str) -> str:
-    """'either(2)' → 'either'"""
-    return _VARIANT_RE.sub('', word)
 
+@dataclass(slots=True)
+class Row:
+    """One ranked rhyme family, in output-column order.
 
-def rhyme_unit(phonemes: list[str]) -> tuple[str, ...] | None:
+    Slotted: ~10-15k of these are held at once, and fixed attribute slots
+    are several times smaller than a per-row dict of string keys.
     """
-    Extract the rhyme unit from an ARPAbet phoneme list.
+    rhyme_unit:        str
+    family_size:       int
+    representative:    str
+    rep_zipf:          float
+    spelling_variants: str
+    all_words:         str
+
+
+def load_cmudict_entries() -> list[tuple[str, list[str]]]:
+    """
+    Parse the cmudict file directly: (lowercased_word, [phoneme, ...]) per
+    line, like nltk.corpus.cmudict.entries() but without the lazy corpus
+    reader's per-line tokenization machinery.  Lines are 'WORD PH1 PH2 ...'
+    (';;;' starts a comment); some distributions insert a pronunciation
+    number as the second column, which is detected and skipped — no ARPAbet
+    phoneme is a bare digit.
+    """
+    path = str(nltk.data.find('corpora/cmudict/cmudict'))
+    entries = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b';;;'):
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            word = parts[0].decode('latin-1').lower()
+            phs = parts[2:] if parts[1].isdigit() else parts[1:]
+            entries.append((word, [p.decode('ascii') for p in phs]))
+    return entries
+
+
+def strip_variant(word: str) -> str:
+    """'either(2)' → 'either'"""
+    # CMUdict's variant marker is always a trailing "(N)".  The vast majority
+    # of entries carry none, so the endswith test exits immediately; for the
+    # rest, plain slicing beats dispatching a regex substitution.
+    if word.endswith(')'):
+        i = word.rfind('(')
+        if i > 0 and word[i + 1:-1].isdigit():
+            return word[:i]
+    return word
+
+
+@functools.lru_cache(maxsize=None)
+def rhyme_unit(phonemes: tuple[str, ...]) -> tuple[str, ...] | None:
+    """
+    Extract the rhyme unit from an ARPAbet phoneme tuple.
 
     Definition: all phonemes from the last *primary-stressed* vowel onward.
     Primary stress is marked by a trailing '1' in ARPAbet, e.g. 'AE1', 'OW1'.
@@ -84,14 +153,21 @@ def rhyme_unit(phonemes: list[str]) -> tuple[str, ...] | None:
       ['AY1', 'DH', 'ER0']          → ('AY1', 'DH', 'ER0')    either (/aɪ/ pron.)
 
     Returns None for words with no primary stress (some abbreviations, etc.).
+
+    Memoized: homophones and shared inflectional endings mean many CMUdict
+    entries carry identical phoneme sequences, and interned phonemes make
+    the tuple keys cheap to hash.
     """
-    last_idx = None
-    for i, ph in enumerate(phonemes):
-        if ph.endswith('1'):
-            last_idx = i
-    return tuple(phonemes[last_idx:]) if last_idx is not None else None
+    # Scan from the right and stop at the first primary stress — on average
+    # this halves the comparisons versus a full left-to-right pass, and the
+    # single-char compare avoids str.endswith method-call overhead.
+    for i in range(len(phonemes) - 1, -1, -1):
+        if phonemes[i][-1] == '1':
+            return tuple(phonemes[i:])
+    return None
 
 
+@functools.lru_cache(maxsize=None)
 def ortho_ending(word: str) -> str:
     """
     Orthographic rime: the substring from the last vowel letter onward.
@@ -104,72 +180,167 @@ def ortho_ending(word: str) -> str:
       'write'  → 'ite'
       'byte'   → 'yte'
       'fight'  → 'ight'   (same pattern as 'night')
+
+    The regex scans in one C-level pass instead of a per-character Python
+    loop, and results are memoized — the same words come back repeatedly
+    across the per-family variant grouping.  Words are already lowercased
+    when canonicalized at load time, so no re-lowering happens here.
     """
-    last_v = -1
-    for i, ch in enumerate(word.lower()):
-        if ch in 'aeiou':
-            last_v = i
-    return word[last_v:].lower() if last_v >= 0 else word.lower()
+    m = _rime_search(word)
+    return m.group(0) if m else word
 
 
-def main():
-    # ── 1. Load CMUdict ───────────────────────────────────────────────────────
-    print("Loading CMUdict (downloading if needed)...")
-    nltk.download('cmudict', quiet=True)
-    # entries() returns (word_string, [phoneme, ...]) for every line in the dict,
-    # including variant lines like ('either(2)', ['AY1', 'DH', 'ER0']).
-    cmu_entries = nltk.corpus.cmudict.entries()
-    print(f"  {len(cmu_entries):,} raw entries (including variants).")
+def placements_cache_path() -> Path:
+    """
+    Cache file for the filtered placement list.
 
-    # ── 2. Collect all pronunciations per canonical word ──────────────────────
-    print("Collecting all pronunciations per word...")
-    word_pronunciations: dict[str, list[list[str]]] = defaultdict(list)
-    for raw_word, phonemes in cmu_entries:
-        canonical = strip_variant(raw_word).lower()
-        word_pronunciations[canonical].append(phonemes)
+    Steps 1-3 are deterministic given the Zipf cutoff, the cmudict file, the
+    installed wordfreq release, and the code itself (_CACHE_VERSION), so
+    those make up the cache key.  CMUdict must already be downloaded when
+    this is called.
+    """
+    cmudict_file = str(nltk.data.find('corpora/cmudict/cmudict'))
+    key = (f"{_CACHE_VERSION}:{ZIPF_CUTOFF}:"
+           f"{os.path.getmtime(cmudict_file)}:{_WORDFREQ_VERSION}")
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME',
+                                    Path.home() / '.cache')) / 'rhymefreq'
+    return cache_dir / f"placements-{digest}.pkl"
 
-    # ── 3. Filter by frequency; map each word to all its rhyme units ──────────
-    print(f"Filtering (Zipf ≥ {ZIPF_CUTOFF}) and extracting rhyme units...")
 
-    # families: rhyme_unit_tuple → {word: zipf_score}
-    # Using a dict as the value deduplicates words that appear via multiple
-    # pronunciations sharing the same rhyme unit.
-    families: dict[tuple, dict[str, float]] = defaultdict(dict)
+def collect_placements() -> tuple[list[tuple[tuple, str, float]], int, int, int]:
+    """
+    Pipeline steps 1-3: load CMUdict and wordfreq, filter by frequency, and
+    extract rhyme units.  Returns (placements, kept, skipped_freq,
+    skipped_stress).  The result is what gets pickled to the cache.
+    """
+    # Every line of the dict, including variant lines like
+    # ('either(2)', ['AY1', 'DH', 'ER0']).
+    cmu_entries = load_cmudict_entries()
+    print(f"  {len(cmu_entries):,} raw entries (including variants).")
+
+    # Load wordfreq's frequency table once instead of calling zipf_frequency()
+    # per word: each API call redoes tokenization and normalization, while a
+    # plain dict lookup is native-speed.  A table miss does NOT mean zero
+    # frequency — zipf_frequency tokenizes its input, so punctuated CMUdict
+    # forms ('bout, a.m., agency's) resolve to real scores the raw table
+    # doesn't carry — so misses fall back to the API, cached per word.
+    print("Loading wordfreq frequency table...")
+    freqs = get_frequency_dict('en', 'large')
+
+    # Filter by frequency and extract rhyme units in one fused pass that
+    # touches each raw entry once, with no intermediate per-word dict.
+    print(f"Filtering (Zipf ≥ {ZIPF_CUTOFF}) and extracting rhyme units...")
 
-    kept, skipped_freq, skipped_stress = 0, 0, 0
-    for word, pron_list in word_pronunciations.items():
-        z = zipf_frequency(word, 'en')
+    # CMUdict uses only ~84 distinct phoneme strings, but parsing hands back
+    # a fresh str object per occurrence.  sys.intern maps them onto CPython's
+    # interned table, so every rhyme-unit tuple is built from shared strings
+    # with cached hashes that compare by pointer.
+
+    # placements: flat (rhyme_unit, word, zipf) triples.  One sort + groupby
+    # later replaces ~600k inserts into a dict-of-dicts, and leaves each
+    # family's members already ordered by descending frequency.
+    placements: list[tuple[tuple, str, float]] = []
+
+    # Zipf scores are derived locally from the raw frequency table:
+    # zipf = log10(frequency per billion words).  Cached by canonical word so
+    # variant lines collapsing to the same form hit the cache (rejections
+    # are cached too, as 0.0).
+    zipf_cache: dict[str, float] = {}
+
+    # One global (word, unit) seen-set deduplicates variant pronunciations
+    # that share a rhyme unit — no tiny per-word set allocations, and the
+    # pair hashes off already-interned members.
+    seen: set[tuple[str, tuple]] = set()
+
+    # Bind the per-iteration attribute and global lookups to locals once —
+    # the interpreter then dispatches them as fast local loads inside this
+    # ~134k-iteration pure-Python loop (and the loop body stays simple
+    # enough for alternative interpreters like PyPy to trace well).
+    cache_get = zipf_cache.get
+    freq_get  = freqs.get
+    log10     = math.log10
+    intern_ph = sys.intern
+    seen_add  = seen.add
+    place     = placements.append
+
+    skipped_freq, skipped_stress = 0, 0
+    for raw_word, phonemes in cmu_entries:
+        canonical = strip_variant(raw_word).lower()
+        z = cache_get(canonical)
+        if z is None:
+            f = freq_get(canonical)
+            if f:
+                # Round to 2 decimals exactly as zipf_frequency does, so the
+                # derived scores (and the :.1f variant labels built from
+                # them) match the API's to the digit.
+                z = round(log10(f * 1e9), 2)
+            else:
+                # Table miss: let zipf_frequency normalize the word.  Slow,
+                # but it runs once per such word and they are a small
+                # minority of the dict.
+                z = zipf_frequency(canonical, 'en')
+            zipf_cache[canonical] = z
         if z < ZIPF_CUTOFF:
             skipped_freq += 1
             continue
 
-        units_seen: set[tuple] = set()
-        for phonemes in pron_list:
-            unit = rhyme_unit(phonemes)
-            if unit is None:
-                skipped_stress += 1
-                continue
-            if unit in units_seen:
-                continue   # two variants happen to share the same rhyme unit
-            units_seen.add(unit)
-            families[unit][word] = z
+        unit = rhyme_unit(tuple(intern_ph(p) for p in phonemes))
+        if unit is None:
+            skipped_stress += 1
+            continue
+
+        key = (canonical, unit)
+        if key in seen:
+            continue   # two variants happen to share the same rhyme unit
+        seen_add(key)
+        place((unit, canonical, z))
+
+    kept = len({word for _, word, _ in placements})
+    return placements, kept, skipped_freq, skipped_stress
 
-        if units_seen:
-            kept += 1
 
-    print(f"  {kept:,} words retained  |  {skipped_freq:,} below Zipf  "
+def main():
+    # ── 1-3. Load, filter, and extract — cached across runs ──────────────────
+    print("Loading CMUdict (downloading if needed)...")
+    nltk.download('cmudict', quiet=True)
+
+    # The filtered placement list is deterministic, so later runs skip the
+    # whole load/filter/classify phase by unpickling it.
+    cache_path = placements_cache_path()
+    if cache_path.exists():
+        print(f"Loading cached placements ({cache_path})...")
+        with open(cache_path, 'rb') as f:
+            placements, kept, skipped_freq, skipped_stress = pickle.load(f)
+    else:
+        placements, kept, skipped_freq, skipped_stress = collect_placements()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((placements, kept, skipped_freq, skipped_stress),
+                        f, protocol=5)
+
+    print(f"  {kept:,} words retained  |  {skipped_freq:,} entries below Zipf  "
           f"|  {skipped_stress:,} stress-less skipped")
-    print(f"  {len(families):,} distinct rhyme units found.")
+    print(f"  {len(placements):,} word placements collected.")
 
     # ── 4. Build output rows ──────────────────────────────────────────────────
     print("Building output rows...")
     rows = []
 
-    for unit, word_z_map in families.items():
-        if len(word_z_map) < MIN_FAMILY_SIZE:
+    # Sort by (unit, -zipf): groupby then walks each family once with its
+    # members already in descending-frequency order, so no per-family sort.
+    # Two stable sorts with C-level itemgetter keys (zipf desc, then unit)
+    # beat one pass with a tuple-building lambda key.
+    placements.sort(key=itemgetter(2), reverse=True)
+    placements.sort(key=itemgetter(0))
+    n_units = 0
+
+    for unit, group in groupby(placements, key=itemgetter(0)):
+        n_units += 1
+        members = [(word, z) for _, word, z in group]
+        if len(members) < MIN_FAMILY_SIZE:
             continue
 
-        members = sorted(word_z_map.items(), key=lambda x: x[1], reverse=True)
         rep_word, rep_zipf = members[0]
 
         # Best (highest-Zipf) word per orthographic ending
@@ -179,31 +350,43 @@ def main():
             if ending not in by_ending or z > by_ending[ending][1]:
                 by_ending[ending] = (word, z)
 
-        variants = sorted(by_ending.values(), key=lambda x: x[1], reverse=True)
-        variant_str = ',  '.join(
-            f"{w} ({z:.1f})" for w, z in variants[:MAX_VARIANTS]
-        )
+        # Top-K selection (O(n log k)) — no need to sort every ending when
+        # only MAX_VARIANTS of them are shown.
+        variants = heapq.nlargest(MAX_VARIANTS, by_ending.values(),
+                                  key=itemgetter(1))
+        variant_str = ',  '.join(f"{w} ({z:.1f})" for w, z in variants)
+
+        rows.append(Row(
+            rhyme_unit=' '.join(unit),
+            family_size=len(members),
+            representative=rep_word,
+            rep_zipf=round(rep_zipf, 2),
+            spelling_variants=variant_str,
+            all_words=', '.join(w for w, _ in members),
+        ))
 
-        rows.append({
-            'rhyme_unit':        ' '.join(unit),
-            'family_size':       len(members),
-            'representative':    rep_word,
-            'rep_zipf':          round(rep_zipf, 2),
-            'spelling_variants': variant_str,
-            'all_words':         ', '.join(w for w, _ in members),
-        })
+    print(f"  {n_units:,} distinct rhyme units found.")
 
     # Sort: largest family first; representative Zipf as tiebreaker
-    rows.sort(key=lambda r: (r['family_size'], r['rep_zipf']), reverse=True)
+    rows.sort(key=attrgetter('family_size', 'rep_zipf'), reverse=True)
 
     # ── 5. Write TSV ──────────────────────────────────────────────────────────
     fields = ['rhyme_unit', 'family_size', 'representative',
               'rep_zipf', 'spelling_variants', 'all_words']
 
-    with open(OUTPUT_TSV, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fields, delimiter='\t')
-        writer.writeheader()
-        writer.writerows(rows)
+    # No field can contain a tab or newline (ARPAbet phonemes and CMUdict
+    # words are plain ASCII), so csv's per-field quoting and dialect logic
+    # is pure overhead here — str.join plus one write does the same job.
+    # Rows are joined with \r\n, csv.writer's default terminator, so the
+    # file stays byte-identical to what the csv-based writer produced
+    # (newline='' keeps Windows from doubling the \r).
+    lines = ['\t'.join(fields)]
+    lines.extend(
+        f"{r.rhyme_unit}\t{r.family_size}\t{r.representative}\t"
+        f"{r.rep_zipf}\t{r.spelling_variants}\t{r.all_words}"
+        for r in rows)
+    with open(OUTPUT_TSV, 'w', encoding='utf-8', newline='') as f:
+        f.write('\r\n'.join(lines) + '\r\n')
 
     print(f"\nWrote {len(rows):,} families → {OUTPUT_TSV}")
     print(f"\nTop 40 most rhymable families:")
@@ -211,9 +394,9 @@ def main():
           f"{'Zipf':>5}  Spelling variants")
     print('─' * 100)
     for i, r in enumerate(rows[:40], 1):
-        print(f"{i:<5} {r['rhyme_unit']:<22} {r['family_size']:>5}  "
-              f"{r['representative']:<16} {r['rep_zipf']:>5}  "
-              f"{r['spelling_variants'][:45]}")
+        print(f"{i:<5} {r.rhyme_unit:<22} {r.family_size:>5}  "
+              f"{r.representative:<16} {r.rep_zipf:>5}  "
+              f"{r.spelling_variants[:45]}")
 
 
 if __name__ == '__main__':
@@ -49,12 +49,22 @@ Columns:
 """
 
 import csv
+import functools
+import heapq
+import io
+import math
+import os
 import re
-from collections import defaultdict
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 import nltk
-from wordfreq import zipf_frequency
+from wordfreq import get_frequency_dict, zipf_frequency
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 ZIPF_CUTOFF     = 2.5   # Minimum Zipf score.
@@ -65,26 +75,100 @@ MAX_VARIANTS    = 6      # Max spelling variants shown per family.
 OUT_DIR         = Path(".")
 # ─────────────────────────────────────────────────────────────────────────────
 
-VOWEL_SET   = set('aeiou')
-_VARIANT_RE = re.compile(r'\(\d+\)$')
+# ZIPF_CUTOFF expressed as a raw wordfreq frequency (zipf = log10(freq) + 9),
+# so clearly sub-cutoff words are rejected with one float compare, before any
+# log10.  Derived scores are rounded to 2 decimals to match zipf_frequency,
+# so the threshold carries a half-rounding-step margin: anything that could
+# round up to the cutoff takes the exact path instead of the fast reject.
+_FREQ_CUTOFF = 10 ** (ZIPF_CUTOFF - 0.005 - 9)
+
+# Last vowel letter plus everything after it — the orthographic rime.
+# Bound search method: skips the attribute lookup on every ortho_ending call.
+_rime_search = re.compile(r'[aeiou][^aeiou]*$').search
+
+
+# Ranking used everywhere rows are ordered: biggest family first, ties broken
+# by representative frequency.  A C-level attrgetter building the key tuple —
+# sort() and heapq.merge both evaluate it once per element, so the
+# decorate-sort-undecorate dance is already built in.
+_RANK_KEY = attrgetter('family_size', 'rep_zipf')
+
+
+@dataclass(slots=True)
+class Row:
+    """One ranked rhyme family.  Slotted — tens of thousands are held at
+    once across the four output lists, and fixed slots beat per-row dicts
+    on both memory and attribute access in the sort keys."""
+    type:              str
+    rhyme_unit:        str
+    syllables_after:   int
+    family_size:       int
+    representative:    str
+    rep_zipf:          float
+    spelling_variants: str
+    all_words:         str
 
 
 # ── Phoneme utilities ─────────────────────────────────────────────────────────
 
+def load_cmudict_entries() -> list[tuple[str, list[str]]]:
+    """
+    Read cmudict straight off disk, bypassing NLTK's corpus-reader layer.
+
+    Yields the same (lowercased_word, phoneme_list) pairs as
+    nltk.corpus.cmudict.entries() — one tight split per line rather than the
+    reader's regexp-driven tokenization.  ';;;' comment lines are skipped,
+    and a bare-digit second column (the pronunciation number some
+    distributions carry) is dropped, since ARPAbet has no all-digit phoneme.
+    """
+    path = str(nltk.data.find('corpora/cmudict/cmudict'))
+    entries = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b';;;'):
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            word = parts[0].decode('latin-1').lower()
+            phs = parts[2:] if parts[1].isdigit() else parts[1:]
+            entries.append((word, [p.decode('ascii') for p in phs]))
+    return entries
+
+
 def strip_variant(word: str) -> str:
-    return _VARIANT_RE.sub('', word)
+    # CMUdict's variant marker is always a trailing "(N)".  Most entries have
+    # none, so the endswith test exits immediately; for the rest, plain
+    # slicing beats dispatching a regex substitution.
+    if word.endswith(')'):
+        i = word.rfind('(')
+        if i > 0 and word[i + 1:-1].isdigit():
+            return word[:i]
+    return word
 
 
-def is_vowel_ph(ph: str) -> bool:
-    """ARPAbet vowel phonemes end with a stress digit (0, 1, or 2)."""
-    return ph[-1] in '012'
+# Every ARPAbet vowel phoneme CMUdict emits: 15 vowels × 3 stress digits.
+# Membership here is one hash probe on an interned (hash-cached) string,
+# cheaper than slicing off the last character and testing it against '012'.
+VOWEL_PHS = frozenset(
+    v + s
+    for v in ('AA', 'AE', 'AH', 'AO', 'AW', 'AY', 'EH', 'ER',
+              'EY', 'IH', 'IY', 'OW', 'OY', 'UH', 'UW')
+    for s in '012')
 
 
-def count_vowels(phonemes) -> int:
-    return sum(1 for ph in phonemes if is_vowel_ph(ph))
+def count_vowels(phonemes: tuple[str, ...]) -> int:
+    return sum(ph in VOWEL_PHS for ph in phonemes)
 
 
-def rhyme_unit_and_type(phonemes: list[str]) -> tuple | None:
+# Rhyme type by vowel count in the unit, as a lookup table: index with
+# min(vowel_count, 3) and the if-elif ladder disappears from the hot path.
+# (Index 0 is unreachable — the unit always contains its stressed vowel.)
+_TYPE_BY_VOWELS = ('masculine', 'masculine', 'feminine', 'dactylic')
+
+
+def rhyme_unit_and_type(
+        phonemes: list[str]) -> tuple[tuple[str, ...], str, int] | None:
     """
     Extract rhyme unit and classify by type.
 
@@ -97,30 +181,27 @@ def rhyme_unit_and_type(phonemes: list[str]) -> tuple | None:
 
     Returns (rhyme_unit_tuple, type_str, syllables_after) or None.
     """
-    last_stress_idx = None
-    for i, ph in enumerate(phonemes):
-        if ph.endswith('1'):
-            last_stress_idx = i
-
-    if last_stress_idx is None:
-        return None
-
-    unit = tuple(phonemes[last_stress_idx:])
-    vowel_count    = count_vowels(unit)
-    syllables_after = vowel_count - 1    # subtract the stressed vowel itself
-
-    if vowel_count <= 1:
-        rtype = 'masculine'
-    elif vowel_count == 2:
-        rtype = 'feminine'
-    else:
-        rtype = 'dactylic'
-
-    return unit, rtype, syllables_after
+    # Single reverse scan: count vowel phonemes as we walk right-to-left and
+    # stop at the first primary stress.  This halves the comparisons versus a
+    # full forward pass and folds in what used to be a second count_vowels()
+    # pass over the unit.
+    vowel_count = 0
+    for i in range(len(phonemes) - 1, -1, -1):
+        ph = phonemes[i]
+        if ph in VOWEL_PHS:
+            vowel_count += 1
+            if ph[-1] == '1':
+                unit = tuple(phonemes[i:])
+                syllables_after = vowel_count - 1   # minus the stressed vowel
+                rtype = _TYPE_BY_VOWELS[min(vowel_count, 3)]
+                return unit, rtype, syllables_after
+
+    return None
 
 
 # ── Orthographic utilities ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def ortho_ending(word: str) -> str:
     """
     Orthographic rime: from the last vowel letter onward.
@@ -128,66 +209,210 @@ def ortho_ending(word: str) -> str:
     Used to surface spelling variants within one phonetic family.
     E.g. in the /AY1 T/ family: 'night'→'ight', 'write'→'ite', 'byte'→'yte'.
     Silent final 'e' is included, correctly distinguishing 'ite' from 'it'.
+
+    Regex-based (one C-level scan, no per-character loop) and memoized, since
+    the same word recurs across families and per-family variant grouping.
+    Words arrive already lowercased (canonicalized once at load time).
     """
-    last_v = -1
-    for i, ch in enumerate(word.lower()):
-        if ch in VOWEL_SET:
-            last_v = i
-    return word[last_v:].lower() if last_v >= 0 else word.lower()
+    m = _rime_search(word)
+    return m.group(0) if m else word
+
+
+# ── Filter / classify workers ─────────────────────────────────────────────────
+
+# Per-process copy of wordfreq's frequency table, installed by the pool
+# initializer so classify_block never has the big dict in its pickled args.
+_WORKER_FREQS: dict[str, float] = {}
+
+
+def _init_classify_worker(freqs: dict[str, float]) -> None:
+    global _WORKER_FREQS
+    _WORKER_FREQS = freqs
+
+
+def classify_block(
+    entries: list[tuple[str, list[str]]],
+) -> tuple[list[tuple[str, tuple, str, float]], dict[str, str], int, int]:
+    """
+    Filter and classify one contiguous block of raw CMUdict entries.
+
+    Runs in a worker process; the block is independent of every other, so
+    the whole dominant pass scales across cores.  Dedup of (unit, type)
+    placements is local to the block — variant lines of one word can
+    straddle a block boundary, so main re-checks during the merge.
+
+    Returns (placements, endings, skipped_freq, skipped_stress).
+    """
+    placements: list[tuple[str, tuple, str, float]] = []
+
+    # Zipf derived locally from the raw table, per wordfreq's own definition:
+    # zipf = log10(freq) + 9, i.e. log10 of occurrences per billion words.
+    # Cached by canonical word so variant spellings collapsing to the same
+    # form short-circuit.
+    zipf_cache: dict[str, float] = {}
+
+    # word → orthographic ending, computed exactly once per qualifying word
+    # here rather than per family member in build_family_row.
+    endings: dict[str, str] = {}
+
+    # word → (unit, type) pairs already placed for it, so variant lines that
+    # classify identically are not double-counted.
+    seen_unit_type: dict[str, set[tuple]] = {}
+
+    # Bind per-iteration lookups to locals — fast local loads in a loop that
+    # runs once per raw entry, and PyPy-friendly to boot.  sys.intern maps
+    # the ~84 phoneme strings and the canonical words onto shared objects
+    # with cached hashes.
+    cache_get = zipf_cache.get
+    freq_get  = _WORKER_FREQS.get
+    place     = placements.append
+    log10     = math.log10
+    classify  = rhyme_unit_and_type
+    intern_s  = sys.intern
+
+    skipped_freq, skipped_stress = 0, 0
+    for raw_word, phonemes in entries:
+        # Interning the canonical word collapses the equal-but-distinct
+        # strings that variant lines produce onto one shared object with a
+        # cached hash — it keys zipf_cache, seen_unit_type, endings, and
+        # every placement tuple, so each repeat lookup gets cheaper and the
+        # duplicate string storage disappears.
+        canonical = intern_s(strip_variant(raw_word).lower())
+        z = cache_get(canonical)
+        if z is None:
+            f = freq_get(canonical)
+            if f is None:
+                # Table miss ≠ zero frequency: zipf_frequency tokenizes its
+                # input, so punctuated CMUdict forms ('bout, a.m., agency's)
+                # resolve to real scores the raw table doesn't carry.  Slow,
+                # but cached — it runs once per such word.
+                z = zipf_frequency(canonical, 'en')
+            elif f < _FREQ_CUTOFF:
+                # Clearly below the cutoff: reject on the raw frequency and
+                # never pay for the log10.  The majority of entries land here.
+                z = 0.0
+            else:
+                # Round to 2 decimals exactly as zipf_frequency does, so the
+                # derived scores (and the :.1f variant labels built from
+                # them) match the API's to the digit.
+                z = round(log10(f * 1e9), 2)
+            zipf_cache[canonical] = z
+        if z < ZIPF_CUTOFF:
+            skipped_freq += 1
+            continue
+
+        result = classify([intern_s(p) for p in phonemes])
+        if result is None:
+            skipped_stress += 1
+            continue
+        unit, rtype, _ = result
+
+        placed = seen_unit_type.setdefault(canonical, set())
+        key = (unit, rtype)
+        if key in placed:
+            continue
+        placed.add(key)
+        if canonical not in endings:
+            endings[canonical] = ortho_ending(canonical)
+        place((rtype, unit, canonical, z))
+
+    return placements, endings, skipped_freq, skipped_stress
 
 
 # ── Family builder ────────────────────────────────────────────────────────────
 
-def build_family_row(unit: tuple, members: list, rtype: str) -> dict:
+def build_family_row(unit: tuple[str, ...], words: list[str],
+                     zipfs: array, rtype: str,
+                     endings: dict[str, str]) -> Row:
     """
     Build one output row for a rhyme family.
-    members: [(word, zipf_score), ...] sorted by score descending.
+    words:   family members, already sorted by zipf descending — the
+             grouping sort in main orders every family's members at once,
+             so the representative, variant scan, and all_words column all
+             read straight off the list.
+    zipfs:   parallel array('d') of the members' Zipf scores.
+    endings: word → orthographic ending, precomputed once per word in the
+             filter pass (this runs per family, and words recur across
+             families, so the per-member ortho_ending call added up).
     """
-    rep_word, rep_zipf = members[0]
     syllables_after = count_vowels(unit) - 1
 
-    by_ending: dict[str, tuple] = {}
-    for word, z in members:
-        ending = ortho_ending(word)
-        if ending not in by_ending or z > by_ending[ending][1]:
-            by_ending[ending] = (word, z)
-
-    variants = sorted(by_ending.values(), key=lambda x: x[1], reverse=True)
-    variant_str = ',  '.join(
-        f"{w} ({z:.1f})" for w, z in variants[:MAX_VARIANTS]
+    # Members are frequency-descending, so the first word seen per ending is
+    # that ending's best — a seen-set dedup replaces the by_ending dict and
+    # its max-compare, and the scan stops once MAX_VARIANTS are collected
+    # instead of touching every member of a large family.
+    seen_endings: set[str] = set()
+    variants = []
+    for word, z in zip(words, zipfs):
+        ending = endings[word]
+        if ending in seen_endings:
+            continue
+        seen_endings.add(ending)
+        variants.append(f"{word} ({z:.1f})")
+        if len(variants) == MAX_VARIANTS:
+            break
+    variant_str = ',  '.join(variants)
+
+    return Row(
+        type=rtype,
+        rhyme_unit=' '.join(unit),
+        syllables_after=syllables_after,
+        family_size=len(words),
+        representative=words[0],
+        rep_zipf=round(zipfs[0], 2),
+        spelling_variants=variant_str,
+        all_words=', '.join(words),
     )
 
-    return {
-        'type':              rtype,
-        'rhyme_unit':        ' '.join(unit),
-        'syllables_after':   syllables_after,
-        'family_size':       len(members),
-        'representative':    rep_word,
-        'rep_zipf':          round(rep_zipf, 2),
-        'spelling_variants': variant_str,
-        'all_words':         ', '.join(w for w, _ in members),
-    }
 
+def build_rows(rtype: str,
+               families: dict[tuple[str, ...], tuple[list[str], array]],
+               endings: dict[str, str]) -> list[Row]:
+    """
+    Build and rank every qualifying family row of one rhyme type.
 
-def write_tsv(rows: list[dict], path: Path, fields: list[str]) -> None:
-    with open(path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fields, delimiter='\t',
-                                extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"  Wrote {len(rows):,} rows → {path}")
+    Lives at module scope (not as a closure in main) so it can be pickled
+    and dispatched to a ProcessPoolExecutor worker.
+    """
+    rows = []
+    for unit, (words, zipfs) in families.items():
+        if len(words) < MIN_FAMILY_SIZE:
+            continue
+        rows.append(build_family_row(unit, words, zipfs, rtype, endings))
 
+    rows.sort(key=_RANK_KEY, reverse=True)
+    return rows
 
-def print_top(rows: list[dict], n: int = 20, label: str = "") -> None:
+
+def write_tsv(rows, path: Path, fields: list[str]) -> None:
+    """Write rows (any iterable of Row) as TSV, streaming — rows are never
+    materialized here, so a lazy merge can feed this directly."""
+    # One multi-name attrgetter builds each row's value tuple in C, replacing
+    # the per-row Python comprehension of getattr calls.
+    get_row = attrgetter(*fields)
+    n = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='\t')
+        writer.writerow(fields)
+        for r in rows:
+            writer.writerow(get_row(r))
+            n += 1
+    print(f"  Wrote {n:,} rows → {path}")
+
+
+def print_top(rows: list[Row], n: int = 20, label: str = "", out=None) -> None:
+    # Writes to `out` when given (e.g. a StringIO collecting the whole
+    # preview for one flush) so dozens of lines don't each pay a stdout
+    # lock-and-write round trip.
     if label:
-        print(f"\n── Top {n} {label} families ──")
+        print(f"\n── Top {n} {label} families ──", file=out)
     print(f"{'Rank':<5} {'Rhyme Unit':<28} {'Syl':>3} {'Size':>5}  "
-          f"{'Rep':<16} {'Zipf':>5}  Variants")
-    print('─' * 100)
+          f"{'Rep':<16} {'Zipf':>5}  Variants", file=out)
+    print('─' * 100, file=out)
     for i, r in enumerate(rows[:n], 1):
-        print(f"{i:<5} {r['rhyme_unit']:<28} {r['syllables_after']:>3} "
-              f"{r['family_size']:>5}  {r['representative']:<16} "
-              f"{r['rep_zipf']:>5}  {r['spelling_variants'][:40]}")
+        print(f"{i:<5} {r.rhyme_unit:<28} {r.syllables_after:>3} "
+              f"{r.family_size:>5}  {r.representative:<16} "
+              f"{r.rep_zipf:>5}  {r.spelling_variants[:40]}", file=out)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -196,99 +421,131 @@ def main():
     # 1. Load CMUdict ─────────────────────────────────────────────────────────
     print("Loading CMUdict (downloading if needed)...")
     nltk.download('cmudict', quiet=True)
-    cmu_entries = nltk.corpus.cmudict.entries()
+    cmu_entries = load_cmudict_entries()
     print(f"  {len(cmu_entries):,} raw entries (including variants).")
 
     # 2. Collect all pronunciations per canonical word ─────────────────────────
-    print("Collecting all pronunciations per word...")
-    word_pronunciations: dict[str, list[list[str]]] = defaultdict(list)
-    for raw_word, phonemes in cmu_entries:
-        canonical = strip_variant(raw_word).lower()
-        word_pronunciations[canonical].append(phonemes)
-
-    # 3. Filter by frequency; classify each (word, pronunciation) pair ─────────
-    print(f"Filtering (Zipf ≥ {ZIPF_CUTOFF}), classifying rhyme types...")
-
-    # by_type[rtype][unit] = {word: zipf_score}
-    by_type: dict[str, dict[tuple, dict[str, float]]] = {
-        'masculine': defaultdict(dict),
-        'feminine':  defaultdict(dict),
-        'dactylic':  defaultdict(dict),
+    # One bulk load of wordfreq's table replaces ~100k zipf_frequency() calls
+    # (each of which re-normalizes its input).  A table miss does NOT mean
+    # zero frequency — punctuated forms resolve through zipf_frequency's
+    # tokenization — so the workers fall back to the API for those.
+    print("Loading wordfreq frequency table...")
+    freqs = get_frequency_dict('en', 'large')
+
+    # 2-3. Filter by frequency and classify, in parallel ───────────────────────
+    # The dominant pass — one filter/classify iteration per raw CMUdict line
+    # — is embarrassingly parallel, so it is split into contiguous blocks and
+    # farmed out to one worker process per core.  Contiguous (not strided)
+    # blocks keep a word's variant lines together, so nearly all dedup
+    # happens worker-side; the merge below re-checks the few that straddle a
+    # boundary.  pool.map preserves block order, keeping output
+    # deterministic.  Flat placement records, (rtype, unit, word, zipf), are
+    # then grouped by one bulk sort + itertools.groupby — the same columnar
+    # layout the basic script uses.
+    print(f"Filtering (Zipf ≥ {ZIPF_CUTOFF}), classifying rhyme types "
+          f"across {os.cpu_count()} cores...")
+
+    n_workers = os.cpu_count() or 1
+    block_size = -(-len(cmu_entries) // n_workers)   # ceil division
+    blocks = [cmu_entries[i:i + block_size]
+              for i in range(0, len(cmu_entries), block_size)]
+
+    placements: list[tuple[str, tuple, str, float]] = []
+    endings: dict[str, str] = {}
+    seen_unit_type: dict[str, set[tuple]] = {}
+    skipped_freq, skipped_stress = 0, 0
+    place = placements.append
+    with ProcessPoolExecutor(max_workers=n_workers,
+                             initializer=_init_classify_worker,
+                             initargs=(freqs,)) as pool:
+        for block_placements, block_endings, sf, ss in \
+                pool.map(classify_block, blocks):
+            skipped_freq += sf
+            skipped_stress += ss
+            endings.update(block_endings)
+            for rec in block_placements:
+                rtype, unit, word, _ = rec
+                placed = seen_unit_type.setdefault(word, set())
+                key = (unit, rtype)
+                if key in placed:
+                    continue
+                placed.add(key)
+                place(rec)
+
+    # Group into families: sort by zipf descending, then stable-sort by
+    # (rtype, unit) so groupby sees each family contiguous with its members
+    # already in output order — build_family_row never re-sorts.
+    # Each family is stored struct-of-arrays: a word list plus a parallel
+    # array('d') of scores.  Eight unboxed bytes per score instead of a
+    # 24-byte boxed float in a per-member 2-tuple — smaller resident index,
+    # and far less to pickle when the families ship to the build workers.
+    # Double, not single, precision: float32 round-trips shift values like
+    # 5.05 just past the two-decimal midpoint, flipping the :.1f variant
+    # labels relative to the float64 scores.
+    placements.sort(key=itemgetter(3), reverse=True)
+    placements.sort(key=itemgetter(0, 1))
+    by_type: dict[str, dict[tuple, tuple[list[str], array]]] = {
+        'masculine': {}, 'feminine': {}, 'dactylic': {},
     }
-
-    kept, skipped_freq, skipped_stress = 0, 0, 0
-    for word, pron_list in word_pronunciations.items():
-        z = zipf_frequency(word, 'en')
-        if z < ZIPF_CUTOFF:
-            skipped_freq += 1
-            continue
-
-        # Track (unit, type) pairs seen for this word to avoid double-counting
-        # when two variant pronunciations map to the same rhyme unit + type.
-        seen_unit_type: set[tuple] = set()
-        placed = False
-        for phonemes in pron_list:
-            result = rhyme_unit_and_type(phonemes)
-            if result is None:
-                skipped_stress += 1
-                continue
-            unit, rtype, _ = result
-            key = (unit, rtype)
-            if key in seen_unit_type:
-                continue
-            seen_unit_type.add(key)
-            by_type[rtype][unit][word] = z
-            placed = True
-
-        if placed:
-            kept += 1
-
-    print(f"  {kept:,} words retained  |  {skipped_freq:,} below Zipf  "
+    for (rtype, unit), group in groupby(placements, key=itemgetter(0, 1)):
+        words: list[str] = []
+        zipfs = array('d')
+        for _, _, word, z in group:
+            words.append(word)
+            zipfs.append(z)
+        by_type[rtype][unit] = (words, zipfs)
+
+    kept = len(seen_unit_type)
+    print(f"  {kept:,} words retained  |  {skipped_freq:,} entries below Zipf  "
           f"|  {skipped_stress:,} stress-less skipped")
     for rtype, d in by_type.items():
-        total_members = sum(len(v) for v in d.values())
+        total_members = sum(len(words) for words, _ in d.values())
         print(f"    {rtype:10}: {total_members:>6,} word-placements "
               f"across {len(d):,} potential families")
 
     # 4. Build rows ────────────────────────────────────────────────────────────
-    print("\nBuilding and ranking family rows...")
-
-    all_rows:  list[dict] = []
-    type_rows: dict[str, list[dict]] = {}
-
-    for rtype, families in by_type.items():
-        rows = []
-        for unit, word_z_map in families.items():
-            if len(word_z_map) < MIN_FAMILY_SIZE:
-                continue
-            members = sorted(word_z_map.items(), key=lambda x: x[1], reverse=True)
-            rows.append(build_family_row(unit, members, rtype))
+    print("\nBuilding, ranking, and writing family rows...")
 
-        rows.sort(key=lambda r: (r['family_size'], r['rep_zipf']), reverse=True)
-        type_rows[rtype] = rows
-        all_rows.extend(rows)
-
-    all_rows.sort(key=lambda r: (r['family_size'], r['rep_zipf']), reverse=True)
-
-    # 5. Write outputs ─────────────────────────────────────────────────────────
-    print("\nWriting output files...")
     base_fields = ['rhyme_unit', 'syllables_after', 'family_size',
                    'representative', 'rep_zipf', 'spelling_variants', 'all_words']
     all_fields  = ['type'] + base_fields
 
-    for rtype, rows in type_rows.items():
-        write_tsv(rows, OUT_DIR / f"rhyme_families_{rtype}.tsv", base_fields)
-    write_tsv(all_rows, OUT_DIR / "rhyme_families_all.tsv", all_fields)
+    # The three rhyme types are fully independent workloads over disjoint
+    # dicts — farm each out to its own process to sidestep the GIL, and
+    # write each per-type TSV the moment its rows come back rather than
+    # buffering all four outputs until a separate write step.
+    type_rows: dict[str, list[Row]] = {}
+    with ProcessPoolExecutor(max_workers=len(by_type)) as pool:
+        futures = {pool.submit(build_rows, rtype, families, endings): rtype
+                   for rtype, families in by_type.items()}
+        for fut in as_completed(futures):
+            rtype = futures[fut]
+            rows = fut.result()
+            write_tsv(rows, OUT_DIR / f"rhyme_families_{rtype}.tsv", base_fields)
+            type_rows[rtype] = rows
+    # Completion order is nondeterministic; re-key for stable preview order.
+    type_rows = {rtype: type_rows[rtype] for rtype in by_type}
+
+    # The three per-type lists are already sorted, so the combined ranking is
+    # a k-way merge — O(N log 3) instead of re-sorting all N rows.  The merge
+    # is streamed straight into the writer; the combined list never exists.
+    write_tsv(heapq.merge(*type_rows.values(), key=_RANK_KEY, reverse=True),
+              OUT_DIR / "rhyme_families_all.tsv", all_fields)
 
     # 6. Preview ───────────────────────────────────────────────────────────────
+    # Collect the whole preview/summary block and emit it with one stdout
+    # write instead of ~60 individually locked-and-flushed print calls.
+    buf = io.StringIO()
     for rtype, rows in type_rows.items():
-        print_top(rows, n=15, label=rtype)
+        print_top(rows, n=15, label=rtype, out=buf)
 
-    print(f"\nSummary:")
+    print("\nSummary:", file=buf)
     for rtype, rows in type_rows.items():
         print(f"  {rtype:10}: {len(rows):,} qualifying families "
-              f"(≥{MIN_FAMILY_SIZE} members, Zipf ≥{ZIPF_CUTOFF})")
-    print(f"  {'combined':10}: {len(all_rows):,} qualifying families total")
+              f"(≥{MIN_FAMILY_SIZE} members, Zipf ≥{ZIPF_CUTOFF})", file=buf)
+    total = sum(len(rows) for rows in type_rows.values())
+    print(f"  {'combined':10}: {total:,} qualifying families total", file=buf)
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == '__main__':